@@ -29,6 +29,7 @@ from twisted.trial._dist.worker import (
     WorkerProtocol,
 )
 from twisted.trial.reporter import TestResult
+from twisted.trial.test import sample
 from twisted.trial.unittest import TestCase
 
 
@@ -71,6 +72,41 @@ class WorkerProtocolTests(TestCase):
         self.serverTransport.clear()
         return d
 
+    def test_runSendsResults(self):
+        """
+        The results of the test run by the L{workercommands.Run} command are
+        sent to the manager before the response.
+        """
+        manager = LocalWorkerAMP()
+        manager.makeConnection(self.clientTransport)
+        result = TestResult()
+        testCase = sample.FooTest("test_foo")
+
+        d = manager.run(testCase, result)
+        self.server.dataReceived(self.clientTransport.value())
+        self.clientTransport.clear()
+        manager.dataReceived(self.serverTransport.value())
+
+        self.assertEqual(1, result.successes)
+        return d
+
+    def test_runSendsLargeFailures(self):
+        """
+        Each failure is sent to the manager in its own command, so that many
+        failures with large messages all reach it.
+        """
+        manager = LocalWorkerAMP()
+        manager.makeConnection(self.clientTransport)
+        result = TestResult()
+        testCase = sample.FooTest("test_foo")
+        manager.run(testCase, result)
+
+        for _ in range(30):
+            self.server._result.addFailure(testCase, Failure(RuntimeError("x" * 3000)))
+        manager.dataReceived(self.serverTransport.value())
+
+        self.assertEqual(30, len(result.failures))
+
     def test_start(self):
         """
         The C{start} command changes the current path.
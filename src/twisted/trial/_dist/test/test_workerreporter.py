@@ -131,3 +131,22 @@ class WorkerReporterTests(TestCase):
         self.assertEqual(
             self.fakeAMProtocol.lastCall, managercommands.AddUnexpectedSuccess
         )
+
+    def test_addErrorFrames(self):
+        """
+        L{WorkerReporter.addError} sends the qualified name of the error type
+        and a flat list of the name, file name and line number of each frame
+        of the failure.
+        """
+        try:
+            1 / 0
+        except ZeroDivisionError:
+            failure = Failure()
+        self.workerReporter.addError(self.test, failure)
+        self.assertEqual(
+            "builtins.ZeroDivisionError", self.fakeAMProtocol.lastArgs["errorClass"]
+        )
+        [(name, filename, lineNumber, _, _)] = failure.frames
+        self.assertEqual(
+            [name, filename, str(lineNumber)], self.fakeAMProtocol.lastArgs["frames"]
+        )
@@ -35,22 +35,24 @@ class WorkerReporter(TestResult):
         super().__init__()
         self.ampProtocol = ampProtocol
 
-    def _getFailure(self, error):
+    def _packFailure(self, error):
         """
-        Convert a C{sys.exc_info()}-style tuple to a L{Failure}, if necessary.
-        """
-        if isinstance(error, tuple):
-            return Failure(error[1], error[0], error[2])
-        return error
+        Extract what is sent over for an error or a failure.
 
-    def _getFrames(self, failure):
-        """
-        Extract frames from a C{Failure} instance.
+        @param error: A L{Failure} or a C{sys.exc_info()}-style tuple.
+
+        @return: A tuple of the message and the qualified class name of the
+            error, and of a flat list of the name, file name and line number
+            of each of its frames.
         """
-        frames = []
-        for frame in failure.frames:
-            frames.extend([frame[0], frame[1], str(frame[2])])
-        return frames
+        if isinstance(error, tuple):
+            error = Failure(error[1], error[0], error[2])
+        frames = [
+            value
+            for frame in error.frames
+            for value in (frame[0], frame[1], str(frame[2]))
+        ]
+        return error.getErrorMessage(), qual(error.type), frames
 
     def addSuccess(self, test):
         """
@@ -66,10 +68,7 @@ class WorkerReporter(TestResult):
         """
         super().addError(test, error)
         testName = test.id()
-        failure = self._getFailure(error)
-        error = failure.getErrorMessage()
-        errorClass = qual(failure.type)
-        frames = [frame for frame in self._getFrames(failure)]
+        error, errorClass, frames = self._packFailure(error)
         self.ampProtocol.callRemote(
             managercommands.AddError,
             testName=testName,
@@ -84,10 +83,7 @@ class WorkerReporter(TestResult):
         """
         super().addFailure(test, fail)
         testName = test.id()
-        failure = self._getFailure(fail)
-        fail = failure.getErrorMessage()
-        failClass = qual(failure.type)
-        frames = [frame for frame in self._getFrames(failure)]
+        fail, failClass, frames = self._packFailure(fail)
         self.ampProtocol.callRemote(
             managercommands.AddFailure,
             testName=testName,